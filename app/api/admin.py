@@ -45,9 +45,9 @@ async def start_question_endpoint(request: dict):
     return {
         "success": True,
         "question_id": question_id,
-        "start_time": session.start_time,
-        "time_limit": time_limit,
-        "buffer_time": buffer_time,
+        "start_time": session.started_at,
+        "time_limit": session.time_limit,
+        "buffer_time": session.buffer_time,
         "message": f"Question {question_id} started. Teams can now submit."
     }
 
@@ -71,14 +71,11 @@ async def stop_question_endpoint(request: dict):
     
     stop_question(question_id)
     
-    completed = sum(1 for ts in session.team_submissions.values() if ts.is_completed)
-    total_subs = sum(len(ts.submit_times) for ts in session.team_submissions.values())
-    
     return {
         "success": True,
         "question_id": question_id,
-        "total_submissions": total_subs,
-        "completed_teams": completed,
+        "total_submissions": session.total_submissions,
+        "completed_teams": session.completed_teams,
         "message": f"Question {question_id} stopped."
     }
 
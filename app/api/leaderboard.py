@@ -37,19 +37,27 @@ async def get_leaderboard_data():
         if not session:
             continue
         
-        # Merge real teams + fake teams
-        all_teams = {**session.team_submissions, **session.fake_teams}
+        # Merge real teams + fake teams (fake teams without submissions map to None)
+        all_teams = {
+            **session.team_submissions,
+            **dict.fromkeys(session.fake_team_names),
+            **session.fake_teams
+        }
         
         for team_id, team_sub in all_teams.items():
             if team_id not in teams_data:
-                display_name = team_sub.team_name or get_team_name(team_id)
+                display_name = (team_sub.team_name if team_sub else None) or get_team_name(team_id)
                 teams_data[team_id] = {
                     "team_name": display_name or team_id,
-                    "is_real": bool(team_sub.team_session_id),
+                    "is_real": bool(team_sub and team_sub.team_session_id),
                     "questions": {},
                     "total_score": 0
                 }
             
+            if team_sub is None:
+                teams_data[team_id]["questions"][q_id] = {"wrong_count": 0, "correct_count": 0, "score": 0}
+                continue
+            
             # Add question data
             teams_data[team_id]["questions"][q_id] = {
                 "wrong_count": team_sub.wrong_count,
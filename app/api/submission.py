@@ -9,7 +9,7 @@ from app.core.normalizer import normalize_kis, normalize_qa, normalize_tr
 from app.core.scoring import score_submission
 from app.core.session import (
     is_question_active, get_elapsed_time, get_remaining_time,
-    get_team_submission, record_submission, get_question_session,
+    get_team_submission, record_real_submission, get_question_session,
     get_current_active_question_id
 )
 from app.models import TeamSubmission
@@ -165,8 +165,8 @@ async def submit_answer(request: Request):
         is_correct = result["correctness_factor"] > 0
         
         # Record submission
-        record_submission(
-            question_id,
+        record_real_submission(
+            session,
             team_id,
             is_correct,
             result["score"] if is_correct else None,
@@ -3,12 +3,22 @@ Question-level session management for AIC 2025 Competition
 Server-controlled timing with per-team submission tracking
 """
 import asyncio
+import bisect
+import heapq
 import logging
 import random
 import time
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
+from app import state
 from app.models import QuestionSession, TeamSubmission
+from app.services.fake_teams import (
+    generate_fake_team_names,
+    generate_submission_attempts,
+    generate_submit_delay,
+    generate_weighted_score,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +29,9 @@ active_questions: Dict[int, QuestionSession] = {}
 # Track currently active question (last started that is still active)
 current_active_question_id: Optional[int] = None
 
+# Max-heap of started sessions: (-start_time, question_id); stale entries popped lazily
+_active_by_start_time: List[Tuple[float, int]] = []
+
 
 def _refresh_active_question_id() -> Optional[int]:
     """
@@ -28,16 +41,15 @@ def _refresh_active_question_id() -> Optional[int]:
     if current_active_question_id and is_question_active(current_active_question_id):
         return current_active_question_id
     
-    # Find the most recently started active session (if any)
-    active_candidates = [
-        (session.start_time, qid)
-        for qid, session in active_questions.items()
-        if is_question_active(qid)
-    ]
-    if active_candidates:
-        _, qid = max(active_candidates)
-        current_active_question_id = qid
-        return current_active_question_id
+    # Find the most recently started active session (if any).
+    # Sessions never reopen, so entries that are closed or superseded by a restart can be dropped.
+    while _active_by_start_time:
+        neg_start_time, qid = _active_by_start_time[0]
+        session = active_questions.get(qid)
+        if session and session.start_time == -neg_start_time and is_question_active(qid):
+            current_active_question_id = qid
+            return current_active_question_id
+        heapq.heappop(_active_by_start_time)
     
     current_active_question_id = None
     return None
@@ -48,102 +60,64 @@ def get_current_active_question_id() -> Optional[int]:
     return _refresh_active_question_id()
 
 
-def initialize_fake_teams(question_id: int) -> Dict[str, TeamSubmission]:
+def initialize_fake_teams() -> Tuple[str, ...]:
     """
-    Initialize fake teams placeholders (submissions will be scheduled with delay)
+    Pick fake team names for a question
+    
+    TeamSubmission records are created lazily by _record_fake_submission, so
+    teams that never submit cost nothing at question start.
     
-    Args:
-        question_id: Question ID
-        
     Returns:
-        Dictionary of fake team submissions (empty, to be populated by background tasks)
+        Tuple of fake team names
     """
-    from app.services.fake_teams import generate_fake_team_names
-    
-    fake_teams = {}
-    team_names = generate_fake_team_names()  # Generate all available fake teams
-    
-    # Initialize empty placeholders - submissions will be added by background tasks
-    for name in team_names:
-        team_sub = TeamSubmission(
-            team_id=name,
-            team_name=name,
-            question_id=question_id,
-            wrong_count=0,
-            correct_count=0,
-            is_completed=False,
-            final_score=None,
-            first_correct_time=None
-        )
-        fake_teams[name] = team_sub
-    
-    return fake_teams
+    return tuple(generate_fake_team_names())  # Generate all available fake teams
 
 
-async def schedule_fake_team_submission(
+async def _drive_fake_team_submissions(
     question_id: int,
-    team_name: str,
-    delay: float,
-    wrong_count: int,
-    correct_count: int,
-    score: Optional[float]
+    events: List[Tuple[float, str, int, int, Optional[float]]]
 ):
     """
-    Schedule a fake team submission after a delay
+    Replay all fake team submissions for a question from a single task
     
     Args:
         question_id: Question ID
-        team_name: Fake team name
-        delay: Delay in seconds before submitting
-        wrong_count: Number of wrong submissions
-        correct_count: Number of correct submissions (0 or 1)
-        score: Final score if correct
+        events: (wake_time, team_name, wrong_count, correct_count, score) tuples sorted by wake_time
     """
-    await asyncio.sleep(delay)
-    
-    # Check if question still exists
     session = active_questions.get(question_id)
     if not session:
         return
     
-    def _is_accepting_submissions() -> bool:
-        if not session.is_active:
-            return False
-        elapsed = time.time() - session.start_time
-        return elapsed <= (session.time_limit + session.buffer_time)
+    deadline = session.start_time + session.time_limit + session.buffer_time
     
-    if not _is_accepting_submissions():
-        return
-    
-    # Submit wrong attempts first
-    for _ in range(wrong_count):
-        if not _is_accepting_submissions():
+    now = time.monotonic()
+    for wake_time, team_name, wrong_count, correct_count, score in events:
+        if wake_time > now:
+            await asyncio.sleep(wake_time - now)
+            now = time.monotonic()
+        
+        # Events are time-ordered, so once the window closes nothing later can land
+        if now > deadline or not session.is_active or active_questions.get(question_id) is not session:
             return
-        record_submission(question_id, team_name, is_correct=False, score=None, team_name=team_name)
-        await asyncio.sleep(random.uniform(1, 5))  # Small delay between attempts
-    
-    # Submit correct answer if still within allowed window
-    if correct_count > 0 and _is_accepting_submissions():
-        record_submission(question_id, team_name, is_correct=True, score=score, team_name=team_name)
-        logger.info("Fake team %s completed Q%s with score %.2f", team_name, question_id, score)
+        
+        _record_fake_submission(session, team_name, wrong_count, correct_count, score, now)
+        if correct_count:
+            logger.info("Fake team %s completed Q%s with score %.2f", team_name, question_id, score)
 
 
 def start_fake_team_submissions(question_id: int):
     """
-    Start background tasks for fake team submissions with random delays
+    Start one background task that replays fake team submissions with random delays
     
     Args:
         question_id: Question ID
     """
-    from app.services.fake_teams import (
-        generate_submission_attempts,
-        generate_weighted_score,
-        generate_submit_delay
-    )
-    
     session = active_questions[question_id]
+    base_time = time.monotonic()
+    deadline = session.start_time + session.time_limit + session.buffer_time
+    events: List[Tuple[float, str, int, int, Optional[float]]] = []
     
-    for team_name in session.fake_teams.keys():
+    for team_name in session.fake_team_names:
         is_special = team_name == "0THING2LOSE"
         wrong_count, correct_count = generate_submission_attempts()
         
@@ -162,20 +136,30 @@ def start_fake_team_submissions(question_id: int):
         # Generate delay
         delay = 5 if is_special else generate_submit_delay(session.time_limit)
         
-        # Create background task
-        asyncio.create_task(
-            schedule_fake_team_submission(
-                question_id=question_id,
-                team_name=team_name,
-                delay=delay,
-                wrong_count=wrong_count,
-                correct_count=correct_count,
-                score=score
-            )
-        )
+        # Wrong attempts come first with a small gap between attempts; attempts past the
+        # deadline never land. Landed wrong attempts are recorded together when the first
+        # one lands, the correct answer as a follow-up event at its own time.
+        first_time = attempt_time = base_time + delay
+        landed = 0
+        for _ in range(wrong_count + correct_count):
+            if attempt_time > deadline:
+                break
+            correct_time = attempt_time
+            landed += 1
+            attempt_time += random.uniform(1, 5)
+        
+        landed_wrong = min(landed, wrong_count)
+        if landed_wrong:
+            events.append((first_time, team_name, landed_wrong, 0, None))
+        if landed > landed_wrong:
+            events.append((correct_time, team_name, 0, 1, score))
+    
+    events.sort(key=itemgetter(0))
+    asyncio.create_task(_drive_fake_team_submissions(question_id, events))
     
     logger.info(
-        "Scheduled fake team submissions for Q%s (delays scaled to %ss limit)",
+        "Scheduled %s fake team submission events for Q%s (delays scaled to %ss limit)",
+        len(events),
         question_id,
         session.time_limit,
     )
@@ -197,19 +181,21 @@ def start_question(question_id: int, time_limit: int = 300, buffer_time: int = 1
     
     session = QuestionSession(
         question_id=question_id,
-        start_time=time.time(),
+        start_time=time.monotonic(),
+        started_at=time.time(),
         time_limit=time_limit,
         buffer_time=buffer_time,
         is_active=True,
         team_submissions={},
-        fake_teams=initialize_fake_teams(question_id)
+        fake_team_names=initialize_fake_teams(),
+        fake_teams={}
     )
     active_questions[question_id] = session
+    heapq.heappush(_active_by_start_time, (-session.start_time, question_id))
     current_active_question_id = question_id
-    logger.info("Question %s started at %.3f (time=%ss, buffer=%ss)", question_id, session.start_time, time_limit, buffer_time)
-    logger.info("Generated %s fake teams for Q%s", len(session.fake_teams), question_id)
+    logger.info("Question %s started at %.3f (time=%ss, buffer=%ss)", question_id, session.started_at, time_limit, buffer_time)
+    logger.info("Generated %s fake teams for Q%s", len(session.fake_team_names), question_id)
     # include already registered real teams
-    from app import state
     for session_id, info in state.TEAM_REGISTRY.items():
         if info["team_id"] not in session.team_submissions:
             session.team_submissions[info["team_id"]] = TeamSubmission(
@@ -246,7 +232,7 @@ def is_question_active(question_id: int) -> bool:
     if not session or not session.is_active:
         return False
     
-    elapsed = time.time() - session.start_time
+    elapsed = time.monotonic() - session.start_time
     return elapsed <= (session.time_limit + session.buffer_time)
 
 
@@ -255,7 +241,7 @@ def get_elapsed_time(question_id: int) -> float:
     session = active_questions.get(question_id)
     if not session:
         return 0.0
-    return time.time() - session.start_time
+    return time.monotonic() - session.start_time
 
 
 def get_remaining_time(question_id: int) -> float:
@@ -277,8 +263,54 @@ def get_team_submission(question_id: int, team_id: str) -> Optional[TeamSubmissi
     return session.team_submissions.get(team_id)
 
 
-def record_submission(
-    question_id: int,
+def _record_attempts(
+    team_sub: TeamSubmission,
+    wrong_count: int,
+    correct_count: int,
+    score: Optional[float],
+    now: float
+) -> bool:
+    """
+    Apply attempts to a team record (wrong attempts come before the correct one)
+    
+    Returns:
+        True if this is the team's first correct submission
+    """
+    team_sub.submit_times.extend([now] * (wrong_count + correct_count))
+    team_sub.wrong_count += wrong_count
+    team_sub.correct_count += correct_count
+    if not correct_count or team_sub.is_completed:
+        return False
+    
+    team_sub.is_completed = True
+    team_sub.first_correct_time = now
+    team_sub.final_score = score
+    return True
+
+
+def _record_fake_submission(
+    session: QuestionSession,
+    team_id: str,
+    wrong_count: int,
+    correct_count: int,
+    score: Optional[float],
+    now: float
+) -> TeamSubmission:
+    """Record fake team attempts (fake teams skip session counters and the per-question leaderboard)"""
+    # Materialize the record in fake_teams on first submission
+    team_sub = session.fake_teams.get(team_id)
+    if team_sub is None:
+        team_sub = session.fake_teams[team_id] = TeamSubmission(
+            team_id=team_id,
+            team_name=team_id,
+            question_id=session.question_id
+        )
+    _record_attempts(team_sub, wrong_count, correct_count, score, now)
+    return team_sub
+
+
+def record_real_submission(
+    session: QuestionSession,
     team_id: str,
     is_correct: bool,
     score: Optional[float] = None,
@@ -287,10 +319,12 @@ def record_submission(
     team_session_id: Optional[str] = None
 ) -> TeamSubmission:
     """
-    Record a team's submission
+    Record a registered team's submission (caller already holds the session)
+    
+    Keeps session counters and the per-question leaderboard index up to date.
     
     Args:
-        question_id: Question ID
+        session: Question session
         team_id: Team ID
         is_correct: Whether submission is correct
         score: Final score if correct
@@ -298,49 +332,61 @@ def record_submission(
     Returns:
         Updated TeamSubmission
     """
-    session = active_questions[question_id]
-    
-    # Check if this is a fake team
-    is_fake_team = team_id in session.fake_teams
-    
-    # Get or create team submission record
-    if is_fake_team:
-        # For fake teams, update the existing record in fake_teams
-        team_sub = session.fake_teams[team_id]
-        if not hasattr(team_sub, 'submit_times'):
-            team_sub.submit_times = []
+    team_sub = session.team_submissions.get(team_id)
+    if team_sub is None:
+        team_sub = session.team_submissions[team_id] = TeamSubmission(
+            team_id=team_id,
+            team_name=team_name or team_id,
+            team_session_id=team_session_id,
+            question_id=session.question_id
+        )
     else:
-        # For real teams, use team_submissions
-        if team_id not in session.team_submissions:
-            session.team_submissions[team_id] = TeamSubmission(
-                team_id=team_id,
-                team_name=team_name or team_id,
-                team_session_id=team_session_id,
-                question_id=question_id,
-                submit_times=[],
-                wrong_count=0,
-                correct_count=0
-            )
-        team_sub = session.team_submissions[team_id]
         if team_name and not team_sub.team_name:
             team_sub.team_name = team_name
         if team_session_id and not team_sub.team_session_id:
             team_sub.team_session_id = team_session_id
     
-    team_sub.submit_times.append(time.time())
-    
-    if not is_correct:
-        team_sub.wrong_count += 1
-    else:
-        team_sub.correct_count += 1
-        if not team_sub.is_completed:  # First correct submission
-            team_sub.is_completed = True
-            team_sub.first_correct_time = time.time()
-            team_sub.final_score = score
+    now = time.monotonic()
+    if _record_attempts(team_sub, 0 if is_correct else 1, 1 if is_correct else 0, score, now):
+        session.completed_teams += 1
+        if score is not None:
+            bisect.insort(session.completed_index, (-score, now - session.start_time, team_id))
+    session.total_submissions += 1
     
     return team_sub
 
 
+def record_submission(
+    question_id: int,
+    team_id: str,
+    is_correct: bool,
+    score: Optional[float] = None,
+    *,
+    team_name: Optional[str] = None,
+    team_session_id: Optional[str] = None
+) -> TeamSubmission:
+    """
+    Record a team's submission (dispatches to the fake or real team path)
+    
+    Args:
+        question_id: Question ID
+        team_id: Team ID
+        is_correct: Whether submission is correct
+        score: Final score if correct
+    
+    Returns:
+        Updated TeamSubmission
+    """
+    session = active_questions[question_id]
+    if team_id in session.fake_team_names:
+        return _record_fake_submission(
+            session, team_id, 0 if is_correct else 1, 1 if is_correct else 0, score, time.monotonic()
+        )
+    return record_real_submission(
+        session, team_id, is_correct, score, team_name=team_name, team_session_id=team_session_id
+    )
+
+
 def stop_question(question_id: int) -> None:
     """Admin stops a question (close submissions immediately)"""
     global current_active_question_id
@@ -363,24 +409,18 @@ def get_question_leaderboard(question_id: int) -> List[dict]:
     if not session:
         return []
     
+    # completed_index is kept sorted by score (desc), then time (asc)
     results = []
-    for team_id, team_sub in session.team_submissions.items():
-        if team_sub.is_completed and team_sub.final_score is not None:
-            time_taken = team_sub.first_correct_time - session.start_time
-            results.append({
-                "team_id": team_id,
-                "score": team_sub.final_score,
-                "time_taken": round(time_taken, 2),
-                "submit_count": len(team_sub.submit_times),
-                "wrong_count": team_sub.wrong_count
-            })
-    
-    # Sort by score (desc), then time (asc)
-    results.sort(key=lambda x: (-x["score"], x["time_taken"]))
-    
-    # Add rank
-    for idx, result in enumerate(results):
-        result["rank"] = idx + 1
+    for rank, (neg_score, time_taken, team_id) in enumerate(session.completed_index, start=1):
+        team_sub = session.team_submissions[team_id]
+        results.append({
+            "team_id": team_id,
+            "score": -neg_score,
+            "time_taken": round(time_taken, 2),
+            "submit_count": len(team_sub.submit_times),
+            "wrong_count": team_sub.wrong_count,
+            "rank": rank
+        })
     
     return results
 
@@ -389,7 +429,6 @@ def get_all_sessions_status() -> List[dict]:
     """Get status of all active questions"""
     status = []
     for qid, session in active_questions.items():
-        total_submissions = sum(len(ts.submit_times) for ts in session.team_submissions.values())
         status.append({
             "question_id": qid,
             "is_active": is_question_active(qid),
@@ -398,8 +437,8 @@ def get_all_sessions_status() -> List[dict]:
             "time_limit": session.time_limit,
             "buffer_time": session.buffer_time,
             "total_teams": len(session.team_submissions),
-            "total_submissions": total_submissions,
-            "completed_teams": sum(1 for ts in session.team_submissions.values() if ts.is_completed)
+            "total_submissions": session.total_submissions,
+            "completed_teams": session.completed_teams
         })
     return status
 
@@ -409,6 +448,7 @@ def reset_all_questions() -> int:
     global current_active_question_id
     count = len(active_questions)
     active_questions.clear()
+    _active_by_start_time.clear()
     current_active_question_id = None
     logger.info("Reset all questions. Cleared %s sessions.", count)
     return count
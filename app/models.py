@@ -1,8 +1,9 @@
 """
 Data models for scoring server
 """
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class GroundTruth(BaseModel):
@@ -50,13 +51,14 @@ class ScoringParams(BaseModel):
     buffer_time: int = 10     # Buffer for network delay
 
 
-class TeamSubmission(BaseModel):
-    """Track one team's submissions for a question"""
+@dataclass(slots=True)
+class TeamSubmission:
+    """Track one team's submissions for a question (slotted: many instances per session)"""
     team_id: str
     question_id: int
     team_name: Optional[str] = None
     team_session_id: Optional[str] = None
-    submit_times: List[float] = Field(default_factory=list)  # Timestamps of all submissions
+    submit_times: List[float] = field(default_factory=list)  # Monotonic timestamps of all submissions
     wrong_count: int = 0                  # k = number of wrong submissions
     correct_count: int = 0                # Number of correct submissions (0 or 1)
     first_correct_time: Optional[float] = None
@@ -67,12 +69,17 @@ class TeamSubmission(BaseModel):
 class QuestionSession(BaseModel):
     """Server-controlled session for one question"""
     question_id: int
-    start_time: float                     # Unix timestamp
+    start_time: float                     # time.monotonic() reading (deltas only)
+    started_at: Optional[float] = None    # Unix timestamp, for clients and logs
     time_limit: int = 300                 # seconds
     buffer_time: int = 10                 # ±10s buffer
     is_active: bool = True
     team_submissions: Dict[str, TeamSubmission] = Field(default_factory=dict)
-    fake_teams: Dict[str, TeamSubmission] = Field(default_factory=dict)  # Fake teams for leaderboard
+    fake_team_names: Tuple[str, ...] = ()  # Fake teams for leaderboard
+    fake_teams: Dict[str, TeamSubmission] = Field(default_factory=dict)  # Created on first fake submission
+    completed_index: List[Tuple[float, float, str]] = Field(default_factory=list)  # Sorted (-score, time_taken, team_id)
+    total_submissions: int = 0            # Real-team submissions recorded
+    completed_teams: int = 0              # Real teams with a correct answer
     
     class Config:
         arbitrary_types_allowed = True
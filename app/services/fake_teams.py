@@ -2,7 +2,8 @@
 Fake teams generator for leaderboard simulation
 """
 import random
-from typing import List, Tuple
+from bisect import bisect_right
+from typing import Sequence, Tuple
 
 # Pool of real AIC 2025 team names + AI Giants
 TEAM_NAMES = [
@@ -18,8 +19,18 @@ TEAM_NAMES = [
     "Hugging Face", "Tesla AI", "Amazon AGI", "Apple MLR", "Baidu AI"
 ]
 
+# Immutable snapshot shared by every question start (no per-call copy)
+_TEAM_NAMES_FROZEN = tuple(TEAM_NAMES)
 
-def generate_fake_team_names(count: int = 36) -> List[str]:
+# Cumulative probability buckets (see docstrings below for the distributions)
+_SCORE_CUM = (0.10, 0.40, 0.75, 1.0)
+_SCORE_RANGES = ((80, 100), (60, 80), (40, 60), (0, 40))
+
+_ATTEMPT_CUM = (0.60, 0.85, 0.95, 1.0)
+_ATTEMPT_OUTCOMES = ((0, 0, 1), (1, 1, 1), (2, 3, 1), (1, 3, 0))  # (min wrong, max wrong, correct)
+
+
+def generate_fake_team_names(count: int = 36) -> Sequence[str]:
     """
     Generate unique team names for fake leaderboard slots
     
@@ -27,15 +38,13 @@ def generate_fake_team_names(count: int = 36) -> List[str]:
         count: Number of fake teams to generate (default 36 - all available teams)
         
     Returns:
-        List of unique team names
+        Sequence of unique team names (shared tuple when all teams are used)
     """
-    available = TEAM_NAMES[:]
-    
     # Use all available teams, or sample if count is less
-    if count >= len(available):
-        return available
+    if count >= len(_TEAM_NAMES_FROZEN):
+        return _TEAM_NAMES_FROZEN
     
-    return random.sample(available, count)
+    return random.sample(_TEAM_NAMES_FROZEN, count)
 
 
 def generate_weighted_score() -> float:
@@ -51,16 +60,8 @@ def generate_weighted_score() -> float:
     Returns:
         Score between 0 and 100
     """
-    rand = random.random()
-    
-    if rand < 0.10:
-        return round(random.uniform(80, 100), 1)
-    elif rand < 0.40:
-        return round(random.uniform(60, 80), 1)
-    elif rand < 0.75:
-        return round(random.uniform(40, 60), 1)
-    else:
-        return round(random.uniform(0, 40), 1)
+    lo, hi = _SCORE_RANGES[bisect_right(_SCORE_CUM, random.random())]
+    return round(random.uniform(lo, hi), 1)
 
 
 def should_submit() -> bool:
@@ -92,16 +93,9 @@ def generate_submission_attempts() -> Tuple[int, int]:
     if not should_submit():
         return (0, 0)  # No submission
     
-    rand = random.random()
-    
-    if rand < 0.60:  # 60% - Correct first try
-        return (0, 1)
-    elif rand < 0.85:  # 25% - 1 wrong then correct
-        return (1, 1)
-    elif rand < 0.95:  # 10% - 2-3 wrong then correct
-        return (random.randint(2, 3), 1)
-    else:  # 5% - Only wrong attempts, no correct
-        return (random.randint(1, 3), 0)
+    min_wrong, max_wrong, correct = _ATTEMPT_OUTCOMES[bisect_right(_ATTEMPT_CUM, random.random())]
+    wrong = min_wrong if min_wrong == max_wrong else random.randint(min_wrong, max_wrong)
+    return (wrong, correct)
 
 
 def generate_submit_delay(time_limit: float) -> float:
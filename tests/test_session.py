@@ -0,0 +1,210 @@
+"""
+Tests for question session tracking and per-question leaderboard
+"""
+import asyncio
+import itertools
+import time
+
+import pytest
+from app.core import session as session_core
+from app.core.session import (
+    get_all_sessions_status,
+    get_current_active_question_id,
+    get_question_leaderboard,
+    record_submission,
+    reset_all_questions,
+    start_question,
+    stop_question,
+)
+from app.models import QuestionSession
+
+
+@pytest.fixture
+def active_session():
+    """Register a bare session (no fake teams, no background tasks)"""
+    reset_all_questions()
+    session = QuestionSession(question_id=1, start_time=time.monotonic())
+    session_core.active_questions[1] = session
+    yield session
+    reset_all_questions()
+
+
+def test_leaderboard_sorted_by_score_then_time(active_session):
+    """Higher score ranks first; ties broken by earlier completion"""
+    record_submission(1, "team-a", is_correct=True, score=70.0)
+    record_submission(1, "team-b", is_correct=False)
+    record_submission(1, "team-b", is_correct=True, score=90.0)
+    record_submission(1, "team-c", is_correct=True, score=70.0)
+
+    leaderboard = get_question_leaderboard(1)
+    assert [row["team_id"] for row in leaderboard] == ["team-b", "team-a", "team-c"]
+    assert [row["rank"] for row in leaderboard] == [1, 2, 3]
+    assert leaderboard[0]["wrong_count"] == 1
+    assert leaderboard[0]["submit_count"] == 2
+
+
+def test_leaderboard_ties_keep_completion_order(active_session):
+    """Equal scores rank by actual completion order, not by team id"""
+    record_submission(1, "team-z", is_correct=True, score=70.0)
+    record_submission(1, "team-a", is_correct=True, score=70.0)
+
+    leaderboard = get_question_leaderboard(1)
+    assert [row["team_id"] for row in leaderboard] == ["team-z", "team-a"]
+
+def test_leaderboard_ignores_incomplete_and_repeat_correct(active_session):
+    """Teams without a correct answer are excluded; later corrects don't re-rank"""
+    record_submission(1, "team-a", is_correct=False)
+    record_submission(1, "team-b", is_correct=True, score=60.0)
+    record_submission(1, "team-b", is_correct=True, score=95.0)
+
+    leaderboard = get_question_leaderboard(1)
+    assert len(leaderboard) == 1
+    assert leaderboard[0]["team_id"] == "team-b"
+    assert leaderboard[0]["score"] == 60.0
+    assert leaderboard[0]["submit_count"] == 2
+
+
+def test_session_status_counters(active_session):
+    """Status reports real-team submission and completion counts"""
+    record_submission(1, "team-a", is_correct=False)
+    record_submission(1, "team-a", is_correct=True, score=80.0)
+    record_submission(1, "team-b", is_correct=False)
+
+    status = get_all_sessions_status()[0]
+    assert status["total_teams"] == 2
+    assert status["total_submissions"] == 3
+    assert status["completed_teams"] == 1
+
+
+def test_leaderboard_unknown_question():
+    """Unknown question returns an empty leaderboard"""
+    reset_all_questions()
+    assert get_question_leaderboard(999) == []
+
+
+def test_active_question_falls_back_to_latest_started():
+    """Stopping the current question hands over to the newest one still open"""
+    async def scenario():
+        start_question(1)
+        start_question(2)
+        start_question(3)
+        stop_question(3)
+        assert get_current_active_question_id() == 2
+        stop_question(1)
+        assert get_current_active_question_id() == 2
+        stop_question(2)
+        assert get_current_active_question_id() is None
+
+    reset_all_questions()
+    asyncio.run(scenario())
+    reset_all_questions()
+
+
+ATTEMPT_GAP = 0.4  # seconds between a fake team's attempts in the tests below
+
+
+def _patch_fake_teams(monkeypatch, outcomes):
+    """
+    Make fake team draws deterministic
+    
+    Args:
+        outcomes: {team_name: (wrong_count, correct_count, delay, score)}; draws repeat on restart
+    """
+    names = tuple(outcomes)
+    plan = [outcomes[name] for name in names]
+    attempts = itertools.cycle([(wrong, correct) for wrong, correct, _, _ in plan])
+    delays = itertools.cycle([delay for wrong, correct, delay, _ in plan if wrong or correct])
+    scores = itertools.cycle([score for _, correct, _, score in plan if correct] or [None])
+
+    monkeypatch.setattr(session_core, "generate_fake_team_names", lambda: names)
+    monkeypatch.setattr(session_core, "generate_submission_attempts", lambda: next(attempts))
+    monkeypatch.setattr(session_core, "generate_submit_delay", lambda time_limit: next(delays))
+    monkeypatch.setattr(session_core, "generate_weighted_score", lambda: next(scores))
+    monkeypatch.setattr(session_core.random, "uniform", lambda a, b: ATTEMPT_GAP)
+
+
+def test_fake_events_expand_wrong_batch_then_correct(monkeypatch):
+    """Landed wrong attempts share one early event; the correct answer follows on its own"""
+    _patch_fake_teams(monkeypatch, {
+        "alpha": (2, 1, 0.1, 55.0),   # attempts at 0.1, 0.5, 0.9
+        "beta": (0, 1, 0.2, 70.0),    # correct at 0.2
+        "gamma": (3, 1, 0.1, 90.0),   # attempts at 0.1, 0.5, 0.9, 1.3 -> correct past deadline
+        "delta": (0, 0, 0.1, None),   # never submits
+        "omega": (1, 0, 1.5, None),   # first attempt past deadline
+    })
+    captured = []
+
+    async def capture(question_id, events):
+        captured.append(events)
+
+    monkeypatch.setattr(session_core, "_drive_fake_team_submissions", capture)
+
+    async def scenario():
+        session = start_question(1, time_limit=1, buffer_time=0)
+        return session.start_time
+
+    reset_all_questions()
+    start_time = asyncio.run(scenario())
+    reset_all_questions()
+
+    events = [
+        (round(wake_time - start_time, 1), team, wrong, correct, score)
+        for wake_time, team, wrong, correct, score in captured[0]
+    ]
+    assert events == [
+        (0.1, "alpha", 2, 0, None),
+        (0.1, "gamma", 3, 0, None),
+        (0.2, "beta", 0, 1, 70.0),
+        (0.9, "alpha", 0, 1, 55.0),
+    ]
+
+
+def test_fake_driver_respects_deadline(monkeypatch):
+    """Recorded fake attempts match the draws that land, none after the deadline"""
+    _patch_fake_teams(monkeypatch, {
+        "alpha": (2, 1, 0.1, 55.0),
+        "gamma": (3, 1, 0.1, 90.0),
+        "omega": (1, 0, 1.5, None),
+    })
+
+    async def scenario():
+        session = start_question(1, time_limit=1, buffer_time=0)
+        await asyncio.sleep(1.6)
+        return session
+
+    reset_all_questions()
+    session = asyncio.run(scenario())
+    reset_all_questions()
+
+    deadline = session.start_time + session.time_limit + session.buffer_time
+    alpha, gamma = session.fake_teams["alpha"], session.fake_teams["gamma"]
+    assert (alpha.wrong_count, alpha.correct_count, alpha.final_score) == (2, 1, 55.0)
+    assert (gamma.wrong_count, gamma.correct_count, gamma.is_completed) == (3, 0, False)
+    assert "omega" not in session.fake_teams
+    assert all(
+        t <= deadline for team_sub in session.fake_teams.values() for t in team_sub.submit_times
+    )
+
+
+def test_fake_driver_halts_on_stop_and_restart(monkeypatch):
+    """Stopping or restarting a question ends the old driver before later events land"""
+    _patch_fake_teams(monkeypatch, {"alpha": (1, 1, 0.1, 55.0)})  # wrong at 0.1, correct at 0.5
+
+    async def scenario():
+        stopped = start_question(1, time_limit=5)
+        restarted = start_question(2, time_limit=5)
+        await asyncio.sleep(0.3)
+        stop_question(1)
+        replacement = start_question(2, time_limit=5)
+        await asyncio.sleep(0.4)
+        return stopped, restarted, replacement
+
+    reset_all_questions()
+    stopped, restarted, replacement = asyncio.run(scenario())
+    reset_all_questions()
+
+    for old_session in (stopped, restarted):
+        alpha = old_session.fake_teams["alpha"]
+        assert (alpha.wrong_count, alpha.correct_count) == (1, 0)
+    # The replacement session's own driver is unaffected
+    assert replacement.fake_teams["alpha"].wrong_count == 1